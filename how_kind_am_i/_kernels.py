@@ -0,0 +1,85 @@
+"""Batch scoring kernels, kept out of ``survey`` so Numba can JIT them.
+
+This module requires NumPy. It stays plain Python even when ``survey`` is
+compiled with mypyc, because Numba can only compile interpreted functions.
+"""
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+
+# Numba is slow to import, so the JIT kernel is built on the first batch call
+# rather than with the package. ``_batch_loop`` stays None without Numba.
+_batch_loop: Optional[Callable[..., np.ndarray]] = None
+_batch_loop_loaded = False
+
+
+def _aggregate_batch_numpy(
+    responses: np.ndarray,
+    one_hot: np.ndarray,
+    lut: np.ndarray,
+    base: int,
+    divisors: np.ndarray,
+) -> np.ndarray:
+    """Per-respondent dimension means for a ``(respondents, questions)`` matrix.
+
+    ``lut[j, r - base]`` is question ``j``'s fixed-point score for raw response
+    ``r``; dimension totals are divided by ``divisors`` (question count times
+    the fixed-point scale) at the end.
+    """
+    n_questions = responses.shape[1]
+    row_starts = np.arange(n_questions) * lut.shape[1] - base
+    scores = lut.ravel().take(row_starts + responses).astype(divisors.dtype)
+    # Summing per dimension is a product with the (questions, dimensions) one-hot
+    # matrix, which hands the whole reduction to a single BLAS GEMM call. The
+    # fixed-point scores are small integers, so the float sums stay exact.
+    return (scores @ one_hot) / divisors
+
+
+def _load_batch_loop() -> Optional[Callable[..., np.ndarray]]:
+    """JIT-compile the parallel batch loop, or return None without Numba."""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def aggregate_batch_loop(
+        responses: np.ndarray,
+        dim_ids: np.ndarray,
+        lut: np.ndarray,
+        base: int,
+        divisors: np.ndarray,
+    ) -> np.ndarray:
+        """``_aggregate_batch_numpy`` with integer totals, one row per thread."""
+        n_rows, n_questions = responses.shape
+        totals = np.zeros((n_rows, divisors.shape[0]), dtype=np.int32)
+        for i in numba.prange(n_rows):
+            for j in range(n_questions):
+                totals[i, dim_ids[j]] += lut[j, responses[i, j] - base]
+        return totals.astype(divisors.dtype) / divisors
+
+    return aggregate_batch_loop
+
+
+def aggregate_batch(
+    responses: np.ndarray,
+    dim_ids: np.ndarray,
+    one_hot: np.ndarray,
+    lut: np.ndarray,
+    base: int,
+    divisors: np.ndarray,
+) -> np.ndarray:
+    """Score a response matrix with the Numba loop, or NumPy without Numba.
+
+    The loop indexes dimensions through ``dim_ids``; the NumPy kernel reduces
+    with the ``one_hot`` matrix instead.
+    """
+    global _batch_loop, _batch_loop_loaded
+    if not _batch_loop_loaded:
+        _batch_loop = _load_batch_loop()
+        _batch_loop_loaded = True
+    if _batch_loop is None:
+        return _aggregate_batch_numpy(responses, one_hot, lut, base, divisors)
+    return _batch_loop(responses, dim_ids, lut, base, divisors)
@@ -3,21 +3,44 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from array import array
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
 from .survey import SurveyEngine, default_models
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 LIKERT_LABEL = "Respond on a scale from 1 (strongly disagree) to 5 (strongly agree)."
+_INVALID_ENTRY = (
+    "Every model entry must be an array of integers representing Likert scores."
+)
+
 
+def prompt_for_responses(
+    questions: Iterable[str], tokens: Optional[Iterator[str]] = None
+) -> List[int]:
+    """Interactively prompt the user for responses.
 
-def prompt_for_responses(questions: Iterable[str]) -> List[int]:
-    """Interactively prompt the user for responses."""
+    When ``tokens`` is given (piped input), answers are consumed from it instead
+    of calling ``input()`` and the prompts are not echoed.
+    """
     responses: List[int] = []
+    raw: Optional[str]
     for index, prompt in enumerate(questions, start=1):
         while True:
             try:
-                value = int(input(f"Q{index}: {prompt}\n> "))
+                if tokens is None:
+                    raw = input(f"Q{index}: {prompt}\n> ")
+                else:
+                    raw = next(tokens, None)
+                    if raw is None:
+                        raise EOFError("Ran out of piped responses.")
+                value = int(raw)
             except ValueError:
                 print("Please provide an integer response.")
                 continue
@@ -29,20 +52,35 @@ def prompt_for_responses(questions: Iterable[str]) -> List[int]:
     return responses
 
 
-def load_responses_from_file(path: Path) -> Dict[str, List[int]]:
-    """Load pre-filled responses from a JSON file."""
-    payload = json.loads(path.read_text(encoding="utf-8"))
+def load_responses_from_file(path: Path) -> Dict[str, Sequence[int]]:
+    """Load pre-filled responses from a JSON file.
+
+    Each model's responses are packed into a signed-byte ``array.array``, which
+    keeps a single respondent on the pure-Python scorer without loading NumPy.
+    """
+    if orjson is not None:
+        payload = orjson.loads(path.read_bytes())
+    else:
+        payload = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(payload, dict):
         raise ValueError("Response file must contain a JSON object.")
-    typed_payload: Dict[str, List[int]] = {}
+    typed_payload: Dict[str, Sequence[int]] = {}
     for model_name, values in payload.items():
-        if not isinstance(values, list) or not all(
-            isinstance(item, int) for item in values
-        ):
-            raise ValueError(
-                "Every model entry must be an array of integers representing Likert scores."
-            )
-        typed_payload[model_name] = values
+        if type(values) is not list:
+            raise ValueError(_INVALID_ENTRY)
+        packed_bytes = array("b")
+        try:
+            packed_bytes.extend(values)
+        except TypeError:
+            raise ValueError(_INVALID_ENTRY) from None
+        except OverflowError:
+            # Keep values that do not fit in a byte so scoring can report them
+            # as out of range, but still reject non-integers.
+            if not all(isinstance(item, int) for item in values):
+                raise ValueError(_INVALID_ENTRY) from None
+            typed_payload[model_name] = values
+            continue
+        typed_payload[model_name] = packed_bytes
     return typed_payload
 
 
@@ -59,28 +97,31 @@ def run_cli(args: argparse.Namespace) -> None:
         return
 
     if args.command == "run":
+        responses: Dict[str, Sequence[int]]
         if args.responses_file:
             responses = load_responses_from_file(Path(args.responses_file))
         else:
-            responses: Dict[str, List[int]] = {}
+            responses = {}
+            tokens = None if sys.stdin.isatty() else iter(sys.stdin.read().split())
             print("\nStarting interactive survey.\n")
             for model in engine.models:
                 print(f"\n-- {model.name} --")
                 print(model.description)
                 print(LIKERT_LABEL)
-                prompts = [question.prompt for question in model.questions]
-                responses[model.name] = prompt_for_responses(prompts)
+                responses[model.name] = prompt_for_responses(model.prompt_list, tokens)
         aggregated = engine.run(responses)
         insights = engine.interpret_relationship_dynamics(aggregated)
 
-        print("\nSurvey summary:\n")
+        report = ["\nSurvey summary:\n"]
         for model_name, dimensions in aggregated.items():
-            print(f"{model_name}:")
+            report.append(f"{model_name}:")
             for dimension, score in dimensions.items():
-                print(f"  {dimension}: {score:.2f}")
-        print("\nRelationship insights:\n")
+                report.append(f"  {dimension}: {score:.2f}")
+        report.append("\nRelationship insights:\n")
         for context, narrative in insights.items():
-            print(f"{context}: {narrative}")
+            report.append(f"{context}: {narrative}")
+        report.append("")
+        sys.stdout.write("\n".join(report))
 
         if args.output:
             output_path = Path(args.output)
@@ -88,9 +129,20 @@ def run_cli(args: argparse.Namespace) -> None:
                 "aggregated_scores": aggregated,
                 "relationship_insights": insights,
             }
-            output_path.write_text(
-                json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS
+                if args.pretty:
+                    option |= orjson.OPT_INDENT_2
+                output_path.write_bytes(orjson.dumps(payload, option=option))
+            elif args.pretty:
+                output_path.write_text(
+                    json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
+                )
+            else:
+                output_path.write_text(
+                    json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                    encoding="utf-8",
+                )
             print(f"\nSaved results to {output_path}")
         return
 
@@ -122,14 +174,24 @@ def build_parser() -> argparse.ArgumentParser:
         "--output",
         help="Optional path to store the aggregated results as JSON.",
     )
+    run_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON written by --output instead of writing it compactly.",
+    )
     run_parser.set_defaults(func=run_cli)
 
     return parser
 
 
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
 def main(argv: List[str] | None = None) -> None:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    args = _PARSER.parse_args(argv)
     args.func(args)
 
 
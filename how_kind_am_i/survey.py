@@ -1,13 +1,90 @@
 """Survey data structures and scoring utilities."""
 from __future__ import annotations
 
+import math
+import sys
 from dataclasses import dataclass, field
-from statistics import mean
-from typing import Dict, Iterable, List, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeGuard,
+)
 
+if TYPE_CHECKING:
+    import numpy
 
-@dataclass(frozen=True)
-class LikertScaleQuestion:
+# NumPy and the batch kernels are bound by _load_numpy on first use, so importing
+# the package (and with it the CLI) does not pay for loading them.
+np: Any = None
+_aggregate_batch: Any = None
+
+
+def _load_numpy() -> bool:
+    """Import NumPy and the batch kernels; return False if NumPy is missing."""
+    global np, _aggregate_batch
+    if np is None:
+        try:
+            import numpy as loaded
+        except ImportError:
+            return False
+        from ._kernels import aggregate_batch
+
+        np, _aggregate_batch = loaded, aggregate_batch
+    return True
+
+
+def _is_ndarray(value: object) -> TypeGuard[numpy.ndarray]:
+    """Whether ``value`` is a NumPy array, without importing NumPy to find out."""
+    module = sys.modules.get("numpy")
+    return module is not None and isinstance(value, module.ndarray)
+
+
+def _out_of_range(
+    raw_value: object,
+    scale_min: int,
+    scale_max: int,
+    respondent: Optional[int] = None,
+) -> ValueError:
+    """Build the error raised for a response outside its question's scale."""
+    source = "" if respondent is None else f" from respondent {respondent}"
+    return ValueError(
+        f"Response {raw_value}{source} is outside the allowed range "
+        f"[{scale_min}, {scale_max}]"
+    )
+
+
+def _wrong_count(name: str, expected: int, received: int) -> ValueError:
+    """Build the error raised when a model gets the wrong number of responses."""
+    return ValueError(f"Expected {expected} responses for {name}, received {received}")
+
+
+class _ScaleCache:
+    """Slot for a question's cached ``1 / (scale_max - scale_min)``.
+
+    It lives on a base class so it is not a dataclass field and stays out of
+    ``fields()``, ``asdict()`` and ``repr()``.
+    """
+
+    __slots__ = ("_inv_range",)
+    _inv_range: float
+
+    def _cache_inv_range(self, scale_min: int, scale_max: int) -> None:
+        object.__setattr__(self, "_inv_range", 1.0 / (scale_max - scale_min))
+
+
+@dataclass(frozen=True, slots=True)
+class LikertScaleQuestion(_ScaleCache):
     """A single Likert-scale question."""
 
     prompt: str
@@ -16,248 +93,851 @@ class LikertScaleQuestion:
     scale_min: int = 1
     scale_max: int = 5
 
+    def __post_init__(self) -> None:
+        if self.scale_max <= self.scale_min:
+            raise ValueError(
+                f"Question {self.prompt!r} needs scale_max greater than scale_min, "
+                f"received [{self.scale_min}, {self.scale_max}]"
+            )
+        # Dimension names such as "Emotional Stability" are not auto-interned, so
+        # intern them to let score lookups match keys by identity.
+        object.__setattr__(self, "dimension", sys.intern(self.dimension))
+        self._cache_inv_range(self.scale_min, self.scale_max)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild through __init__ so a mypyc-compiled frozen class unpickles too.
+        return (
+            LikertScaleQuestion,
+            (
+                self.prompt,
+                self.dimension,
+                self.reverse_scored,
+                self.scale_min,
+                self.scale_max,
+            ),
+        )
+
     def normalise(self, raw_value: int) -> float:
         """Convert a raw Likert response into a normalised value."""
-        if raw_value < self.scale_min or raw_value > self.scale_max:
-            raise ValueError(
-                f"Response {raw_value} is outside the allowed range "
-                f"[{self.scale_min}, {self.scale_max}]"
+        if not self.scale_min <= raw_value <= self.scale_max:
+            raise _out_of_range(raw_value, self.scale_min, self.scale_max)
+        normalised = (raw_value - self.scale_min) * self._inv_range
+        return 1.0 - normalised if self.reverse_scored else normalised
+
+
+# Largest model _generate_aggregator writes straight-line source for. Each
+# dimension's mean is a chain of ``+`` terms, and CPython's compiler recurses
+# once per term, so much longer chains raise RecursionError; bigger models are
+# scored by _loop_aggregator instead.
+_GENERATED_AGGREGATOR_LIMIT: Final = 256
+
+
+def _loop_aggregator(
+    name: str,
+    questions: Sequence[LikertScaleQuestion],
+    dim_names: Tuple[str, ...],
+) -> Callable[[Iterable[int]], Dict[str, float]]:
+    """Build an aggregate function that loops over per-question coefficients.
+
+    Adds the terms in the same order as the generated code, so both produce
+    identical scores and errors.
+    """
+    dimension_index = {dim: index for index, dim in enumerate(dim_names)}
+    coefficients = tuple(
+        (
+            q.scale_min,
+            q.scale_max,
+            q._inv_range,
+            q.reverse_scored,
+            dimension_index[q.dimension],
+        )
+        for q in questions
+    )
+    counts = [0] * len(dim_names)
+    for question in questions:
+        counts[dimension_index[question.dimension]] += 1
+    expected = len(questions)
+
+    def aggregate(responses: Iterable[int]) -> Dict[str, float]:
+        values = responses if isinstance(responses, (list, tuple)) else list(responses)
+        if len(values) != expected:
+            raise _wrong_count(name, expected, len(values))
+        totals = [0.0] * len(dim_names)
+        for raw, (low, high, inv_range, reverse, dim) in zip(values, coefficients):
+            if not low <= raw <= high:
+                raise _out_of_range(raw, low, high)
+            normalised = (raw - low) * inv_range
+            totals[dim] += 1.0 - normalised if reverse else normalised
+        return {
+            dim: total / count for dim, total, count in zip(dim_names, totals, counts)
+        }
+
+    return aggregate
+
+
+def _generate_aggregator(
+    name: str,
+    questions: Sequence[LikertScaleQuestion],
+    dim_names: Tuple[str, ...],
+) -> Callable[[Iterable[int]], Dict[str, float]]:
+    """Build an aggregate function specialised to a fixed list of questions.
+
+    The scale bounds, reverse scoring and dimension grouping are written into
+    the generated source as literals, so the function body is straight-line
+    arithmetic with no per-question lookups. The result keys are taken from
+    ``dim_names`` so they are the model's interned dimension strings. Models
+    with more than ``_GENERATED_AGGREGATOR_LIMIT`` questions get
+    ``_loop_aggregator`` instead.
+    """
+    if len(questions) > _GENERATED_AGGREGATOR_LIMIT:
+        return _loop_aggregator(name, questions, dim_names)
+    names = [f"r{index}" for index in range(len(questions))]
+    lines = [
+        "def aggregate(responses):",
+        "    if not isinstance(responses, (list, tuple)):",
+        "        responses = list(responses)",
+        f"    if len(responses) != {len(questions)}:",
+        f"        raise _wrong_count({name!r}, {len(questions)}, len(responses))",
+    ]
+    if names:
+        lines.append(f"    {', '.join(names)}, = responses")
+    terms: Dict[str, List[str]] = {}
+    for local, question in zip(names, questions):
+        low, high = question.scale_min, question.scale_max
+        lines.append(f"    if not {low} <= {local} <= {high}:")
+        lines.append(f"        raise _out_of_range({local}, {low}, {high})")
+        term = f"({local} - {low}) * {question._inv_range!r}"
+        if question.reverse_scored:
+            term = f"(1.0 - {term})"
+        terms.setdefault(question.dimension, []).append(term)
+    means = ", ".join(
+        f"_dims[{index}]: ({' + '.join(terms[dim])}) / {len(terms[dim])}"
+        for index, dim in enumerate(dim_names)
+    )
+    lines.append(f"    return {{{means}}}")
+    namespace: Dict[str, Any] = {
+        "_out_of_range": _out_of_range,
+        "_wrong_count": _wrong_count,
+        "_dims": dim_names,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["aggregate"]
+
+
+class _QuestionTable:
+    """Structure-of-arrays view of a question list for the NumPy scorers.
+
+    Each array holds one entry per question, in question order. This is a plain
+    class rather than a dataclass because mypyc resolves dataclass annotations
+    at import time, before NumPy has been loaded.
+    """
+
+    __slots__ = (
+        "dim_ids",
+        "dim_counts",
+        "scale_min",
+        "scale_max",
+        "inv_range",
+        "rev_sign",
+        "rev_bias",
+    )
+
+    def __init__(
+        self,
+        dim_ids: numpy.ndarray,
+        dim_counts: numpy.ndarray,
+        scale_min: numpy.ndarray,
+        scale_max: numpy.ndarray,
+        inv_range: numpy.ndarray,
+        rev_sign: numpy.ndarray,
+        rev_bias: numpy.ndarray,
+    ) -> None:
+        self.dim_ids = dim_ids
+        self.dim_counts = dim_counts
+        self.scale_min = scale_min
+        self.scale_max = scale_max
+        self.inv_range = inv_range
+        self.rev_sign = rev_sign
+        self.rev_bias = rev_bias
+
+    @classmethod
+    def from_questions(
+        cls,
+        questions: Sequence[LikertScaleQuestion],
+        dimension_index: Dict[str, int],
+    ) -> _QuestionTable:
+        """Build the table from question objects and a dimension-to-id map."""
+        reverse = np.array([q.reverse_scored for q in questions], dtype=bool)
+        dim_ids = np.array(
+            [dimension_index[q.dimension] for q in questions], dtype=np.intp
+        )
+        return cls(
+            dim_ids=dim_ids,
+            dim_counts=np.bincount(dim_ids, minlength=len(dimension_index)),
+            scale_min=np.array([q.scale_min for q in questions], dtype=np.float64),
+            scale_max=np.array([q.scale_max for q in questions], dtype=np.float64),
+            inv_range=np.array([q._inv_range for q in questions], dtype=np.float64),
+            rev_sign=np.where(reverse, -1.0, 1.0),
+            rev_bias=reverse.astype(np.float64),
+        )
+
+    @classmethod
+    def concatenate(cls, tables: Sequence[_QuestionTable]) -> _QuestionTable:
+        """Join tables end to end, offsetting dimension ids to stay unique."""
+        offsets = np.cumsum([0] + [len(t.dim_counts) for t in tables[:-1]])
+        return cls(
+            dim_ids=np.concatenate(
+                [t.dim_ids + offset for t, offset in zip(tables, offsets)]
+            ),
+            dim_counts=np.concatenate([t.dim_counts for t in tables]),
+            scale_min=np.concatenate([t.scale_min for t in tables]),
+            scale_max=np.concatenate([t.scale_max for t in tables]),
+            inv_range=np.concatenate([t.inv_range for t in tables]),
+            rev_sign=np.concatenate([t.rev_sign for t in tables]),
+            rev_bias=np.concatenate([t.rev_bias for t in tables]),
+        )
+
+    def out_of_range(self, values: numpy.ndarray) -> numpy.ndarray:
+        """Mask of responses outside their question's scale."""
+        return (values < self.scale_min) | (values > self.scale_max)
+
+    def normalise(self, values: numpy.ndarray) -> numpy.ndarray:
+        """Normalise responses (along the last axis) into ``[0, 1]``."""
+        scaled = (values - self.scale_min) * self.inv_range
+        return self.rev_bias + self.rev_sign * scaled
+
+    def means(self, responses: numpy.ndarray) -> numpy.ndarray:
+        """Dimension means for one respondent's responses.
+
+        Raises ``ValueError`` for the first response outside its question's scale.
+        """
+        values = np.asarray(responses, dtype=np.float64)
+        out_of_range = self.out_of_range(values)
+        if out_of_range.any():
+            index = int(out_of_range.argmax())
+            raise _out_of_range(
+                responses[index], int(self.scale_min[index]), int(self.scale_max[index])
             )
-        distance = raw_value - self.scale_min
-        scale_range = self.scale_max - self.scale_min
-        normalised = distance / scale_range
-        if self.reverse_scored:
-            return 1.0 - normalised
-        return normalised
+        totals = np.bincount(
+            self.dim_ids,
+            weights=self.normalise(values),
+            minlength=len(self.dim_counts),
+        )
+        return totals / self.dim_counts
+
+
+# Largest fixed-point dimension total the batch kernels accept: float32 holds
+# every integer up to 2**24 exactly, and it is well inside their int32 totals.
+_FIXED_POINT_LIMIT: Final = 2**24
+
+
+def _score_lookup_table(
+    questions: Sequence[LikertScaleQuestion], max_questions_per_dim: int
+) -> Optional[Tuple[numpy.ndarray, int, int]]:
+    """Tabulate every question's normalised scores as exact fixed-point integers.
+
+    Returns ``(lut, base, scale)`` where ``lut[j, r - base] / scale`` is the
+    normalised score of raw response ``r`` to question ``j``. ``scale`` is the
+    least common multiple of the scale ranges, so every entry is exact. Returns
+    ``None`` when a dimension total could exceed ``_FIXED_POINT_LIMIT``.
+    """
+    scale = math.lcm(*(q.scale_max - q.scale_min for q in questions))
+    if scale * max_questions_per_dim > _FIXED_POINT_LIMIT:
+        return None
+    base = min((q.scale_min for q in questions), default=0)
+    width = max((q.scale_max for q in questions), default=0) - base + 1
+    dtype = np.int16 if scale <= np.iinfo(np.int16).max else np.int32
+    lut = np.zeros((len(questions), width), dtype=dtype)
+    for row, question in enumerate(questions):
+        step = scale // (question.scale_max - question.scale_min)
+        for raw in range(question.scale_min, question.scale_max + 1):
+            value = (raw - question.scale_min) * step
+            lut[row, raw - base] = scale - value if question.reverse_scored else value
+    return lut, base, scale
+
+
+class _BatchTables:
+    """The extra tables ``SurveyModel.aggregate_batch`` needs for one model."""
+
+    __slots__ = ("one_hot", "lut", "base", "divisors")
+
+    def __init__(
+        self, questions: Sequence[LikertScaleQuestion], table: _QuestionTable
+    ) -> None:
+        one_hot = np.zeros((len(questions), len(table.dim_counts)), dtype=np.float32)
+        one_hot[np.arange(len(questions)), table.dim_ids] = 1
+        self.one_hot: numpy.ndarray = one_hot
+        # Batch scoring is memory-bound, so it gathers small fixed-point integers
+        # and only converts to float32 for the final division; float16 would be
+        # narrower still but NumPy emulates its arithmetic on most CPUs.
+        lookup = _score_lookup_table(questions, int(table.dim_counts.max(initial=0)))
+        self.lut: Optional[numpy.ndarray] = None
+        self.base = 0
+        self.divisors: Optional[numpy.ndarray] = None
+        if lookup is not None:
+            self.lut, self.base, scale = lookup
+            self.divisors = (table.dim_counts * scale).astype(np.float32)
+
+
+def _derived() -> Any:
+    """Declare a slot that ``__post_init__`` fills from the other fields."""
+    return field(init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SurveyModel:
-    """Represents a validated psychological framework expressed as a survey."""
+    """Represents a validated psychological framework expressed as a survey.
+
+    Models are immutable: the scoring code is compiled from the questions once,
+    and ``default_models`` shares the same instances between callers.
+    """
 
     name: str
     description: str
-    questions: List[LikertScaleQuestion]
-    dimension_aliases: Dict[str, str] = field(default_factory=dict)
+    # Stored as a tuple; typed as a Sequence so mypyc builds still accept lists.
+    questions: Sequence[LikertScaleQuestion]
+    # Read-only view; excluded from hashing since mappings are unhashable.
+    dimension_aliases: Mapping[str, str] = field(default_factory=dict, hash=False)
+    _prompts: Tuple[str, ...] = _derived()
+    _dim_names: Tuple[str, ...] = _derived()
+    _compiled_aggregate: Callable[[Iterable[int]], Dict[str, float]] = _derived()
+    # NumPy tables, built on first use by _vector_table and _batch_tables.
+    _table: Optional[_QuestionTable] = _derived()
+    _batch: Optional[_BatchTables] = _derived()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "questions", tuple(self.questions))
+        object.__setattr__(
+            self, "dimension_aliases", MappingProxyType(dict(self.dimension_aliases))
+        )
+        self._compile()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The generated aggregator cannot be pickled, so rebuild the model from
+        # its fields and let __post_init__ compile it again.
+        return (
+            SurveyModel,
+            (
+                self.name,
+                self.description,
+                self.questions,
+                dict(self.dimension_aliases),
+            ),
+        )
+
+    @property
+    def prompt_list(self) -> Tuple[str, ...]:
+        """The question prompts in presentation order."""
+        return self._prompts
+
+    def _compile(self) -> None:
+        """Precompute the per-question scoring coefficients used by ``aggregate``."""
+        questions = self.questions
+        dimension_index: Dict[str, int] = {}
+        for question in questions:
+            dimension_index.setdefault(question.dimension, len(dimension_index))
+        dim_names = tuple(dimension_index)
+        object.__setattr__(self, "_prompts", tuple(q.prompt for q in questions))
+        object.__setattr__(self, "_dim_names", dim_names)
+        object.__setattr__(
+            self,
+            "_compiled_aggregate",
+            _generate_aggregator(self.name, questions, dim_names),
+        )
+        object.__setattr__(self, "_table", None)
+        object.__setattr__(self, "_batch", None)
+
+    def _vector_table(self) -> _QuestionTable:
+        """The model's ``_QuestionTable``, built on first use."""
+        table = self._table
+        if table is None:
+            if not _load_numpy():
+                raise ImportError("Vectorised scoring requires NumPy.")
+            dimension_index = {name: i for i, name in enumerate(self._dim_names)}
+            table = _QuestionTable.from_questions(self.questions, dimension_index)
+            object.__setattr__(self, "_table", table)
+        return table
+
+    def _batch_tables(self) -> _BatchTables:
+        """The model's ``_BatchTables``, built on first use."""
+        batch = self._batch
+        if batch is None:
+            batch = _BatchTables(self.questions, self._vector_table())
+            object.__setattr__(self, "_batch", batch)
+        return batch
 
     def aggregate(self, responses: Iterable[int]) -> Dict[str, float]:
         """Aggregate responses into normalised dimension scores."""
-        dimension_scores: Dict[str, List[float]] = {}
-        for question, response in zip(self.questions, responses):
-            dimension_scores.setdefault(question.dimension, []).append(
-                question.normalise(response)
+        if _is_ndarray(responses):
+            return self._aggregate_vectorised(responses)
+        return self._compiled_aggregate(responses)
+
+    def _aggregate_vectorised(self, responses: numpy.ndarray) -> Dict[str, float]:
+        """NumPy implementation of ``aggregate`` using the compiled coefficients."""
+        table = self._vector_table()
+        if responses.shape != table.scale_min.shape:
+            raise _wrong_count(self.name, len(self.questions), len(responses))
+        return dict(zip(self._dim_names, table.means(responses).tolist()))
+
+    @property
+    def dimension_names(self) -> Tuple[str, ...]:
+        """Dimension names in the column order used by ``aggregate_batch``."""
+        return self._dim_names
+
+    def aggregate_batch(self, responses: numpy.ndarray) -> numpy.ndarray:
+        """Aggregate a ``(respondents, questions)`` matrix of responses.
+
+        Returns a ``(respondents, dimensions)`` ``float32`` array of normalised
+        scores whose columns follow ``dimension_names``. Requires NumPy; the
+        inner loop is compiled with Numba when it is installed.
+        """
+        if not _load_numpy():
+            raise ImportError("Batch aggregation requires NumPy.")
+        table = self._vector_table()
+        batch = self._batch_tables()
+        values = np.asarray(responses)
+        if values.ndim != 2 or values.shape[1] != len(self.questions):
+            raise ValueError(
+                f"Expected a (respondents, {len(self.questions)}) response matrix "
+                f"for {self.name}, received shape {values.shape}"
+            )
+        # The lookup table is indexed by raw response, so only whole numbers can
+        # be scored; booleans and integral floats are converted below.
+        kind = values.dtype.kind
+        if kind not in "biuf" or (
+            kind == "f" and not np.array_equal(values, np.trunc(values))
+        ):
+            raise ValueError(
+                f"Expected whole-number responses for {self.name}, "
+                f"received {values.dtype} values"
             )
-        return {dim: mean(values) for dim, values in dimension_scores.items()}
+        out_of_range = table.out_of_range(values)
+        if out_of_range.any():
+            row, index = np.argwhere(out_of_range)[0]
+            question = self.questions[index]
+            raise _out_of_range(
+                values[row, index], question.scale_min, question.scale_max, int(row)
+            )
+        if kind not in "iu":
+            values = values.astype(np.int64)
+        if batch.lut is None:
+            # No exact fixed-point table for these scales; score in float64.
+            totals = table.normalise(values) @ batch.one_hot
+            return (totals / table.dim_counts).astype(np.float32)
+        return _aggregate_batch(
+            values,
+            table.dim_ids,
+            batch.one_hot,
+            batch.lut,
+            batch.base,
+            batch.divisors,
+        )
+
+
+# Flat score keys used by the insight rules, grouped by the model they come from
+# so each model's scores are fetched once. The names are interned so they are the
+# same objects as the keys SurveyModel produces.
+_SCORE_SOURCES: Final[Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]] = tuple(
+    (sys.intern(model), tuple((key, sys.intern(dim)) for key, dim in dimensions))
+    for model, dimensions in (
+        (
+            "Big Five Snapshot",
+            (
+                ("agreeableness", "Agreeableness"),
+                ("extraversion", "Extraversion"),
+                ("stability", "Emotional Stability"),
+                ("conscientiousness", "Conscientiousness"),
+                ("openness", "Openness"),
+            ),
+        ),
+        (
+            "Attachment & Trust",
+            (("trust", "Trust Propensity"), ("boundary", "Boundary Clarity")),
+        ),
+        (
+            "Collaboration Style",
+            (("support", "Support Orientation"), ("structure", "Structure Preference")),
+        ),
+        (
+            "Work Orientation & Craft",
+            (("autonomy", "Autonomy Drive"), ("mastery", "Mastery Focus")),
+        ),
+        ("Team Psychological Safety", (("safety", "Psychological Safety"),)),
+        (
+            "Learning Mindset & Resilience",
+            (("learning", "Learning Agility"), ("resilience", "Challenge Resilience")),
+        ),
+        (
+            "Technical Influence Exchange",
+            (
+                ("empathy", "Empathic Communication"),
+                ("feedback", "Feedback Exchange"),
+                ("coaching", "Mentorship Stance"),
+            ),
+        ),
+    )
+)
+
+_TRAIT_INDEX: Final[Dict[str, int]] = {
+    key: index
+    for index, key in enumerate(
+        key for _, dimensions in _SCORE_SOURCES for key, _ in dimensions
+    )
+}
+
+# A condition is (trait, ">" or "<", threshold); a branch is (conditions,
+# narrative) and applies when all of its conditions hold. A rule is (context,
+# branches, fallback): its branches are checked in order and the fallback
+# narrative is used when none applies.
+_Condition = Tuple[str, str, float]
+_Branch = Tuple[Tuple[_Condition, ...], str]
+_Rule = Tuple[str, Tuple[_Branch, ...], str]
+
+_INSIGHT_RULES: Final[Tuple[_Rule, ...]] = (
+    (
+        "General Liking",
+        (
+            (
+                (
+                    ("agreeableness", ">", 0.7),
+                    ("extraversion", ">", 0.6),
+                    ("empathy", ">", 0.6),
+                ),
+                "Your blend of social ease and empathic signalling primes others to "
+                "enjoy collaborating with you both socially and in technical spaces.",
+            ),
+            (
+                (("stability", ">", 0.6), ("empathy", ">", 0.5)),
+                "People experience you as steady and considerate—qualities that help "
+                "new teammates warm up even when you stay succinct.",
+            ),
+        ),
+        "Initial impressions may feel analytical. Share personal motivations "
+        "early on to help others map your intent.",
+    ),
+    (
+        "Technical Collaboration",
+        (
+            (
+                (("mastery", ">", 0.7), ("conscientiousness", ">", 0.7)),
+                "Your reputation leans toward precise, craft-focused delivery. Expect "
+                "others to seek you out for architectural reviews and refactoring work.",
+            ),
+            (
+                (("openness", ">", 0.6), ("autonomy", ">", 0.6)),
+                "You shine in greenfield problem spaces—co-create lightweight "
+                "guardrails so partners feel looped into your explorations.",
+            ),
+            (
+                (("structure", ">", 0.6),),
+                "Documenting interfaces and test strategies early will showcase your "
+                "systems thinking and make pairing smoother.",
+            ),
+        ),
+        "Clarify how you balance experimentation with delivery to align "
+        "expectations on technical depth and velocity.",
+    ),
+    (
+        "Manager Relationship",
+        (
+            (
+                (("trust", ">", 0.7), ("feedback", ">", 0.6)),
+                "Your managers will read you as a reliable escalation partner who "
+                "proactively surfaces trade-offs and listens to coaching.",
+            ),
+            (
+                (("boundary", "<", 0.4),),
+                "Agree on decision scopes explicitly so leaders know when to step in "
+                "versus give you space.",
+            ),
+            (
+                (("autonomy", ">", 0.65),),
+                "Share your preferred operating rhythm to reassure managers that "
+                "autonomy will still produce visibility.",
+            ),
+        ),
+        "Regular demo notes and retro snippets will help managers stay synced to "
+        "your impact without micromanaging.",
+    ),
+    (
+        "Peer Relationship",
+        (
+            (
+                (("safety", ">", 0.65), ("feedback", ">", 0.6)),
+                "You foster candid design discussions and make code reviews feel like "
+                "shared problem solving.",
+            ),
+            (
+                (("agreeableness", ">", 0.7), ("support", ">", 0.6)),
+                "Expect peers to appreciate your pairing invites and backlog gardening.",
+            ),
+            (
+                (("support", "<", 0.4),),
+                "Schedule routine async updates to offset any perception that you avoid "
+                "collaborative planning.",
+            ),
+        ),
+        "Keep signalling curiosity in peers' approaches to deepen mutual trust.",
+    ),
+    (
+        "Mentor/Lead Relationship",
+        (
+            (
+                (("coaching", ">", 0.65), ("mastery", ">", 0.6)),
+                "Mentees will see you as an invested coach who pairs growth plans with "
+                "clear quality bars.",
+            ),
+            (
+                (("structure", ">", 0.7), ("openness", ">", 0.5)),
+                "Structured onboarding plus openness to new tooling keeps your reports "
+                "learning without feeling boxed in.",
+            ),
+            (
+                (("structure", "<", 0.4),),
+                "Co-create working agreements to ensure junior engineers know how to "
+                "ask for feedback.",
+            ),
+        ),
+        "Blend documented guidance with exploratory growth conversations.",
+    ),
+    (
+        "Learning Community",
+        (
+            (
+                (("extraversion", ">", 0.6), ("learning", ">", 0.6)),
+                "You animate study chats with live demos and curated references, keeping "
+                "threads vibrant.",
+            ),
+            (
+                (("resilience", ">", 0.65),),
+                "Sharing how you iterate through bugs encourages others to open up about "
+                "their stuck points.",
+            ),
+        ),
+        "Post recap notes and invite lightning talks to sustain momentum online.",
+    ),
+    (
+        "Code Review Dynamics",
+        (
+            (
+                (("mastery", ">", 0.7), ("feedback", ">", 0.6)),
+                "Review feedback will read as craft-enriching and actionable—expect "
+                "teammates to request your sign-off.",
+            ),
+            (
+                (("safety", "<", 0.45),),
+                "Signal positive intent and ask clarifying questions before offering "
+                "refactors to keep reviews collaborative.",
+            ),
+            (
+                (("conscientiousness", ">", 0.65),),
+                "Your detail orientation keeps regressions out; summarise priorities so "
+                "authors know what to tackle first.",
+            ),
+        ),
+        "Offer context on architectural goals to ensure review comments land well.",
+    ),
+)
+
+_INSIGHT_CONTEXTS: Final[Tuple[str, ...]] = tuple(
+    context for context, _, _ in _INSIGHT_RULES
+)
+
+# _INSIGHT_RULES with trait names resolved to score-vector indices and the
+# operator to ``above`` (True for ">"). Comparisons stay explicit so a NaN score
+# fails every condition. Entries line up with _INSIGHT_CONTEXTS, so the compiled
+# rules drop the context name and keep (branches, fallback).
+_CompiledCondition = Tuple[int, bool, float]
+_CompiledBranch = Tuple[Tuple[_CompiledCondition, ...], str]
+_CompiledRule = Tuple[Tuple[_CompiledBranch, ...], str]
+
+_COMPILED_INSIGHT_RULES: Final[Tuple[_CompiledRule, ...]] = tuple(
+    (
+        tuple(
+            (
+                tuple(
+                    (_TRAIT_INDEX[trait], op == ">", threshold)
+                    for trait, op, threshold in conditions
+                ),
+                narrative,
+            )
+            for conditions, narrative in branches
+        ),
+        fallback,
+    )
+    for _, branches, fallback in _INSIGHT_RULES
+)
+
+
+def _evaluate_insights(vector: Sequence[float]) -> Dict[str, str]:
+    """Pick the narrative for each context from a packed score vector."""
+    narratives: List[str] = []
+    for branches, fallback in _COMPILED_INSIGHT_RULES:
+        for conditions, narrative in branches:
+            for index, above, threshold in conditions:
+                score = vector[index]
+                if not (score > threshold if above else score < threshold):
+                    break
+            else:
+                narratives.append(narrative)
+                break
+        else:
+            narratives.append(fallback)
+    return dict(zip(_INSIGHT_CONTEXTS, narratives))
+
+
+# Insights for a respondent with no scores at all, where every trait is 0.5.
+_DEFAULT_INSIGHTS: Final[Dict[str, str]] = _evaluate_insights([0.5] * len(_TRAIT_INDEX))
 
 
 class SurveyEngine:
     """Combines multiple survey models and derives contextual insights."""
 
     def __init__(self, models: Iterable[SurveyModel]):
-        self.models = list(models)
+        # The engine compiles tables from its models below, so it keeps them in
+        # a tuple; the shared tuple from ``default_models`` is used as is.
+        self.models: Tuple[SurveyModel, ...] = (
+            models if isinstance(models, tuple) else tuple(models)
+        )
+        # Built on the first run_structured call; model names must be unique there.
+        self._record_dtype: Optional[numpy.dtype] = None
+        self._compile()
 
-    def run(self, responses: Dict[str, List[int]]) -> Dict[str, Dict[str, float]]:
-        """Run the engine using the provided responses for each model."""
-        results: Dict[str, Dict[str, float]] = {}
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (SurveyEngine, (self.models,))
+
+    def _compile(self) -> None:
+        """Record where each model's dimensions sit in the combined score vector."""
+        self._model_dim_slices: List[Tuple[SurveyModel, int, int]] = []
+        offset = 0
+        for model in self.models:
+            stop = offset + len(model.dimension_names)
+            self._model_dim_slices.append((model, offset, stop))
+            offset = stop
+        # Every model's coefficients concatenated; built by _vector_table.
+        self._table: Optional[_QuestionTable] = None
+
+    def _vector_table(self) -> _QuestionTable:
+        """Concatenate every model's coefficients for single-pass scoring."""
+        if self._table is None:
+            self._table = _QuestionTable.concatenate(
+                [model._vector_table() for model in self.models]
+            )
+        return self._table
+
+    def run(
+        self, responses: Dict[str, Sequence[int]]
+    ) -> Dict[str, Dict[str, float]]:
+        """Run the engine using the provided responses for each model.
+
+        Responses may be lists or NumPy integer arrays.
+        """
+        vectorise = bool(self.models)
         for model in self.models:
             model_responses = responses.get(model.name, [])
             if len(model_responses) != len(model.questions):
-                raise ValueError(
-                    f"Expected {len(model.questions)} responses for {model.name}, "
-                    f"received {len(model_responses)}"
+                raise _wrong_count(
+                    model.name, len(model.questions), len(model_responses)
                 )
-            results[model.name] = model.aggregate(model_responses)
+            vectorise = vectorise and _is_ndarray(model_responses)
+        if vectorise:
+            return self._run_vectorised(responses)
+        results: Dict[str, Dict[str, float]] = {}
+        for model in self.models:
+            results[model.name] = model.aggregate(responses.get(model.name, []))
         return results
 
-    def interpret_relationship_dynamics(
-        self, aggregated_scores: Dict[str, Dict[str, float]]
-    ) -> Dict[str, str]:
-        """Generate qualitative insights for different social contexts."""
-        big_five = aggregated_scores.get("Big Five Snapshot", {})
-        attachment = aggregated_scores.get("Attachment & Trust", {})
-        collaboration = aggregated_scores.get("Collaboration Style", {})
-        motivation = aggregated_scores.get("Work Orientation & Craft", {})
-        safety = aggregated_scores.get("Team Psychological Safety", {})
-        mindset = aggregated_scores.get("Learning Mindset & Resilience", {})
-        influence = aggregated_scores.get("Technical Influence Exchange", {})
-
-        insights: Dict[str, str] = {}
-
-        def describe_liking() -> str:
-            agreeableness = big_five.get("Agreeableness", 0.5)
-            extraversion = big_five.get("Extraversion", 0.5)
-            stability = big_five.get("Emotional Stability", 0.5)
-            empathy = influence.get("Empathic Communication", 0.5)
-            if agreeableness > 0.7 and extraversion > 0.6 and empathy > 0.6:
-                return (
-                    "Your blend of social ease and empathic signalling primes others to "
-                    "enjoy collaborating with you both socially and in technical spaces."
-                )
-            if stability > 0.6 and empathy > 0.5:
-                return (
-                    "People experience you as steady and considerate—qualities that help "
-                    "new teammates warm up even when you stay succinct."
-                )
-            return (
-                "Initial impressions may feel analytical. Share personal motivations "
-                "early on to help others map your intent."
-            )
+    def _run_vectorised(
+        self, responses: Dict[str, Sequence[int]]
+    ) -> Dict[str, Dict[str, float]]:
+        """Score NumPy responses for every model in one pass."""
+        table = self._vector_table()
+        values = np.concatenate([responses[model.name] for model in self.models])
+        means = table.means(values).tolist()
+        return {
+            model.name: dict(zip(model.dimension_names, means[start:stop]))
+            for model, start, stop in self._model_dim_slices
+        }
 
-        def describe_technical_relationship() -> str:
-            conscientiousness = big_five.get("Conscientiousness", 0.5)
-            openness = big_five.get("Openness", 0.5)
-            mastery = motivation.get("Mastery Focus", 0.5)
-            autonomy = motivation.get("Autonomy Drive", 0.5)
-            structure = collaboration.get("Structure Preference", 0.5)
-            if mastery > 0.7 and conscientiousness > 0.7:
-                return (
-                    "Your reputation leans toward precise, craft-focused delivery. Expect "
-                    "others to seek you out for architectural reviews and refactoring work."
-                )
-            if openness > 0.6 and autonomy > 0.6:
-                return (
-                    "You shine in greenfield problem spaces—co-create lightweight "
-                    "guardrails so partners feel looped into your explorations."
-                )
-            if structure > 0.6:
-                return (
-                    "Documenting interfaces and test strategies early will showcase your "
-                    "systems thinking and make pairing smoother."
-                )
-            return (
-                "Clarify how you balance experimentation with delivery to align "
-                "expectations on technical depth and velocity."
-            )
-
-        def describe_manager_relationship() -> str:
-            trust = attachment.get("Trust Propensity", 0.5)
-            boundary = attachment.get("Boundary Clarity", 0.5)
-            autonomy = motivation.get("Autonomy Drive", 0.5)
-            feedback = influence.get("Feedback Exchange", 0.5)
-            if trust > 0.7 and feedback > 0.6:
-                return (
-                    "Your managers will read you as a reliable escalation partner who "
-                    "proactively surfaces trade-offs and listens to coaching."
-                )
-            if boundary < 0.4:
-                return (
-                    "Agree on decision scopes explicitly so leaders know when to step in "
-                    "versus give you space."
-                )
-            if autonomy > 0.65:
-                return (
-                    "Share your preferred operating rhythm to reassure managers that "
-                    "autonomy will still produce visibility."
-                )
-            return (
-                "Regular demo notes and retro snippets will help managers stay synced to "
-                "your impact without micromanaging."
-            )
+    def run_batch(
+        self, responses: Dict[str, numpy.ndarray]
+    ) -> Dict[str, Dict[str, numpy.ndarray]]:
+        """Score many respondents at once.
 
-        def describe_peer_relationship() -> str:
-            agreeableness = big_five.get("Agreeableness", 0.5)
-            support = collaboration.get("Support Orientation", 0.5)
-            safety_avg = safety.get("Psychological Safety", 0.5)
-            feedback = influence.get("Feedback Exchange", 0.5)
-            if safety_avg > 0.65 and feedback > 0.6:
-                return (
-                    "You foster candid design discussions and make code reviews feel like "
-                    "shared problem solving."
-                )
-            if agreeableness > 0.7 and support > 0.6:
-                return (
-                    "Expect peers to appreciate your pairing invites and backlog gardening."
-                )
-            if support < 0.4:
-                return (
-                    "Schedule routine async updates to offset any perception that you avoid "
-                    "collaborative planning."
-                )
-            return (
-                "Keep signalling curiosity in peers' approaches to deepen mutual trust."
-            )
+        ``responses`` maps each model name to a ``(respondents, questions)``
+        matrix. The result mirrors ``run`` with one score array per dimension.
+        """
+        if not _load_numpy():
+            raise ImportError("Batch scoring requires NumPy.")
+        results: Dict[str, Dict[str, numpy.ndarray]] = {}
+        for model in self.models:
+            if model.name not in responses:
+                raise ValueError(f"Missing batch responses for {model.name}")
+            scores = model.aggregate_batch(responses[model.name])
+            results[model.name] = {
+                dim: scores[:, index]
+                for index, dim in enumerate(model.dimension_names)
+            }
+        return results
 
-        def describe_subordinate_relationship() -> str:
-            guidance = collaboration.get("Structure Preference", 0.5)
-            openness = big_five.get("Openness", 0.5)
-            mastery = motivation.get("Mastery Focus", 0.5)
-            coaching = influence.get("Mentorship Stance", 0.5)
-            if coaching > 0.65 and mastery > 0.6:
-                return (
-                    "Mentees will see you as an invested coach who pairs growth plans with "
-                    "clear quality bars."
-                )
-            if guidance > 0.7 and openness > 0.5:
-                return (
-                    "Structured onboarding plus openness to new tooling keeps your reports "
-                    "learning without feeling boxed in."
-                )
-            if guidance < 0.4:
-                return (
-                    "Co-create working agreements to ensure junior engineers know how to "
-                    "ask for feedback."
-                )
-            return (
-                "Blend documented guidance with exploratory growth conversations."
-            )
+    def run_structured(self, responses: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """Score many respondents into a packed NumPy record array.
 
-        def describe_chatroom_relationship() -> str:
-            extraversion = big_five.get("Extraversion", 0.5)
-            openness = big_five.get("Openness", 0.5)
-            resilience = mindset.get("Challenge Resilience", 0.5)
-            learning = mindset.get("Learning Agility", 0.5)
-            if extraversion > 0.6 and learning > 0.6:
-                return (
-                    "You animate study chats with live demos and curated references, keeping "
-                    "threads vibrant."
-                )
-            if resilience > 0.65:
-                return (
-                    "Sharing how you iterate through bugs encourages others to open up about "
-                    "their stuck points."
-                )
-            return (
-                "Post recap notes and invite lightning talks to sustain momentum online."
+        Takes the same input as ``run_batch`` and returns one record per
+        respondent, with a nested ``float32`` field per model and dimension, e.g.
+        ``records["Big Five Snapshot"]["Openness"]``.
+        """
+        if not _load_numpy():
+            raise ImportError("Structured results require NumPy.")
+        if self._record_dtype is None:
+            self._record_dtype = np.dtype(
+                [
+                    (model.name, [(dim, "f4") for dim in model.dimension_names])
+                    for model in self.models
+                ]
             )
-
-        def describe_code_review() -> str:
-            conscientiousness = big_five.get("Conscientiousness", 0.5)
-            safety_avg = safety.get("Psychological Safety", 0.5)
-            feedback = influence.get("Feedback Exchange", 0.5)
-            mastery = motivation.get("Mastery Focus", 0.5)
-            if mastery > 0.7 and feedback > 0.6:
-                return (
-                    "Review feedback will read as craft-enriching and actionable—expect "
-                    "teammates to request your sign-off."
-                )
-            if safety_avg < 0.45:
-                return (
-                    "Signal positive intent and ask clarifying questions before offering "
-                    "refactors to keep reviews collaborative."
-                )
-            if conscientiousness > 0.65:
-                return (
-                    "Your detail orientation keeps regressions out; summarise priorities so "
-                    "authors know what to tackle first."
+        dtype = self._record_dtype
+        records = None
+        for model in self.models:
+            if model.name not in responses:
+                raise ValueError(f"Missing batch responses for {model.name}")
+            scores = model.aggregate_batch(responses[model.name])
+            if records is None:
+                records = np.empty(scores.shape[0], dtype=dtype)
+            elif scores.shape[0] != records.shape[0]:
+                raise ValueError(
+                    f"Expected {records.shape[0]} respondents for {model.name}, "
+                    f"received {scores.shape[0]}"
                 )
-            return (
-                "Offer context on architectural goals to ensure review comments land well."
-            )
+            model_records = records[model.name]
+            for index, dim in enumerate(model.dimension_names):
+                model_records[dim] = scores[:, index]
+        if records is None:
+            records = np.empty(0, dtype=dtype)
+        return records
 
-        insights["General Liking"] = describe_liking()
-        insights["Technical Collaboration"] = describe_technical_relationship()
-        insights["Manager Relationship"] = describe_manager_relationship()
-        insights["Peer Relationship"] = describe_peer_relationship()
-        insights["Mentor/Lead Relationship"] = describe_subordinate_relationship()
-        insights["Learning Community"] = describe_chatroom_relationship()
-        insights["Code Review Dynamics"] = describe_code_review()
-
-        return insights
+    def interpret_relationship_dynamics(
+        self, aggregated_scores: Dict[str, Dict[str, float]]
+    ) -> Dict[str, str]:
+        """Generate qualitative insights for different social contexts."""
+        if not any(model in aggregated_scores for model, _ in _SCORE_SOURCES):
+            return dict(_DEFAULT_INSIGHTS)
+        vector: List[float] = []
+        for model, dimensions in _SCORE_SOURCES:
+            model_scores = aggregated_scores.get(model, {})
+            for _, dimension in dimensions:
+                vector.append(model_scores.get(dimension, 0.5))
+        return _evaluate_insights(vector)
 
 
+@lru_cache(maxsize=1)
 def default_models() -> Tuple[SurveyModel, ...]:
-    """Factory for the default survey models used by the CLI."""
-    big_five_questions = [
+    """Factory for the default survey models used by the CLI.
+
+    The models are built once per process and shared between callers.
+    """
+    big_five_questions = (
         LikertScaleQuestion(
             "I make friends easily during new project kickoffs.", "Extraversion"
         ),
@@ -334,9 +1014,9 @@ def default_models() -> Tuple[SurveyModel, ...]:
         LikertScaleQuestion(
             "I love reading papers or RFCs about emerging tools.", "Openness"
         ),
-    ]
+    )
 
-    attachment_questions = [
+    attachment_questions = (
         LikertScaleQuestion(
             "I find it easy to depend on other people.", "Trust Propensity"
         ),
@@ -349,9 +1029,9 @@ def default_models() -> Tuple[SurveyModel, ...]:
         LikertScaleQuestion(
             "I prefer solving problems alone.", "Boundary Clarity", reverse_scored=True
         ),
-    ]
+    )
 
-    collaboration_questions = [
+    collaboration_questions = (
         LikertScaleQuestion(
             "I enjoy facilitating group retrospectives.", "Support Orientation"
         ),
@@ -374,9 +1054,9 @@ def default_models() -> Tuple[SurveyModel, ...]:
             "I create templates or runbooks to share team knowledge.",
             "Structure Preference",
         ),
-    ]
+    )
 
-    work_orientation_questions = [
+    work_orientation_questions = (
         LikertScaleQuestion(
             "I push for autonomy in how I implement solutions.", "Autonomy Drive"
         ),
@@ -399,9 +1079,9 @@ def default_models() -> Tuple[SurveyModel, ...]:
             "I see how our team's impact ladders into company goals.",
             "Purpose Alignment",
         ),
-    ]
+    )
 
-    psychological_safety_questions = [
+    psychological_safety_questions = (
         LikertScaleQuestion(
             "Members of this team are able to bring up tough technical issues.",
             "Psychological Safety",
@@ -430,9 +1110,9 @@ def default_models() -> Tuple[SurveyModel, ...]:
             "Working with this team, my unique skills are valued.",
             "Psychological Safety",
         ),
-    ]
+    )
 
-    learning_mindset_questions = [
+    learning_mindset_questions = (
         LikertScaleQuestion(
             "I see challenging bugs as opportunities to expand my skills.",
             "Learning Agility",
@@ -459,9 +1139,9 @@ def default_models() -> Tuple[SurveyModel, ...]:
             "I bounce back quickly after an incident postmortem.",
             "Challenge Resilience",
         ),
-    ]
+    )
 
-    influence_exchange_questions = [
+    influence_exchange_questions = (
         LikertScaleQuestion(
             "I tailor technical explanations to the audience's context.",
             "Empathic Communication",
@@ -486,7 +1166,7 @@ def default_models() -> Tuple[SurveyModel, ...]:
             "I help teammates connect their growth plans to project work.",
             "Mentorship Stance",
         ),
-    ]
+    )
 
     return (
         SurveyModel(
@@ -0,0 +1,117 @@
+"""Tests for the scoring functions SurveyModel builds from its questions."""
+from __future__ import annotations
+
+import random
+import unittest
+from typing import Dict, List, Sequence
+
+from how_kind_am_i.survey import (
+    _GENERATED_AGGREGATOR_LIMIT,
+    LikertScaleQuestion,
+    SurveyModel,
+)
+
+# (scale_min, scale_max) pairs the generated questions cycle through.
+_SCALES = ((1, 5), (1, 7), (0, 10), (-3, 3), (1, 2))
+
+
+def _questions(count: int, dimensions: int) -> List[LikertScaleQuestion]:
+    """Questions with mixed scales and reverse scoring across ``dimensions``."""
+    questions = []
+    for index in range(count):
+        low, high = _SCALES[index % len(_SCALES)]
+        questions.append(
+            LikertScaleQuestion(
+                f"Q{index}",
+                f"D{index % dimensions}",
+                reverse_scored=index % 3 == 0,
+                scale_min=low,
+                scale_max=high,
+            )
+        )
+    return questions
+
+
+def _responses(questions: Sequence[LikertScaleQuestion], seed: int) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randint(q.scale_min, q.scale_max) for q in questions]
+
+
+def _expected(
+    questions: Sequence[LikertScaleQuestion], responses: Sequence[int]
+) -> Dict[str, float]:
+    """Dimension means computed one question at a time with ``normalise``."""
+    totals: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+    for question, raw in zip(questions, responses):
+        dimension = question.dimension
+        if dimension in totals:
+            totals[dimension] += question.normalise(raw)
+        else:
+            totals[dimension] = question.normalise(raw)
+        counts[dimension] = counts.get(dimension, 0) + 1
+    return {dim: total / counts[dim] for dim, total in totals.items()}
+
+
+class AggregateTests(unittest.TestCase):
+    def assert_matches_normalise(self, count: int, dimensions: int) -> None:
+        questions = _questions(count, dimensions)
+        model = SurveyModel("Test", "", questions)
+        for seed in range(3):
+            responses = _responses(questions, seed)
+            expected = _expected(questions, responses)
+            self.assertEqual(model.aggregate(responses), expected)
+            self.assertEqual(model.aggregate(tuple(responses)), expected)
+            self.assertEqual(model.aggregate(iter(responses)), expected)
+
+    def test_small_model(self) -> None:
+        self.assert_matches_normalise(12, 3)
+
+    def test_generated_limit(self) -> None:
+        self.assert_matches_normalise(_GENERATED_AGGREGATOR_LIMIT, 1)
+
+    def test_past_generated_limit(self) -> None:
+        self.assert_matches_normalise(_GENERATED_AGGREGATOR_LIMIT + 1, 1)
+
+    def test_large_single_dimension(self) -> None:
+        self.assert_matches_normalise(3000, 1)
+
+    def test_very_large_model(self) -> None:
+        self.assert_matches_normalise(50_000, 7)
+
+    def test_extreme_responses(self) -> None:
+        questions = _questions(10, 2)
+        model = SurveyModel("Test", "", questions)
+        for responses in (
+            [q.scale_min for q in questions],
+            [q.scale_max for q in questions],
+        ):
+            self.assertEqual(model.aggregate(responses), _expected(questions, responses))
+
+    def test_out_of_range_matches_normalise(self) -> None:
+        for count in (10, _GENERATED_AGGREGATOR_LIMIT + 1):
+            questions = _questions(count, 2)
+            model = SurveyModel("Test", "", questions)
+            responses = _responses(questions, 0)
+            for raw in (questions[4].scale_min - 1, questions[4].scale_max + 1):
+                responses[4] = raw
+                with self.assertRaises(ValueError) as expected:
+                    questions[4].normalise(raw)
+                with self.assertRaises(ValueError) as received:
+                    model.aggregate(responses)
+                self.assertEqual(str(received.exception), str(expected.exception))
+
+    def test_wrong_count(self) -> None:
+        for count in (10, _GENERATED_AGGREGATOR_LIMIT + 1):
+            model = SurveyModel("Test", "", _questions(count, 2))
+            with self.assertRaisesRegex(
+                ValueError, f"Expected {count} responses for Test, received 3"
+            ):
+                model.aggregate([1, 1, 1])
+
+    def test_empty_model(self) -> None:
+        self.assertEqual(SurveyModel("Empty", "", []).aggregate([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()